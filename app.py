@@ -1,11 +1,34 @@
+import hashlib
 import os
 import random
-from flask import Flask, jsonify, render_template, request
-from services.product_service import get_all_products
-from services.sales_service import simulate_sales, get_sales_trend
-from db_config import get_connection
-
-app = Flask(__name__)
+import threading
+from flask import Blueprint, Flask, Response, abort, current_app, jsonify, render_template, request, stream_with_context
+from services.asset_service import IMMUTABLE_CACHE_CONTROL, asset_body, asset_revision, asset_url, get_asset, init_assets, load_assets
+from services.catalog_store import CatalogStore, ProductRows
+from services.export_service import (
+    AGENT_LOG_EXPORT_FIELDS,
+    PRODUCT_EXPORT_FIELDS,
+    SIGNAL_EXPORT_FIELDS,
+    csv_lines,
+    iter_agent_logs,
+    iter_products,
+    ndjson_lines
+)
+from services.forecast_service import forecast_version, get_forecast
+from services.product_service import get_all_products, get_catalog_version
+from services.response_service import FastJSONProvider, compress_response, encoding_etags
+from services.sales_service import simulate_sales
+from services.throttle_service import SingleFlight, TokenBucketLimiter, rate_limited
+from services.ui_state_service import ensure_ui_state_table, load_ui_state, persist_ui_state
+from services.write_behind import WriteBehindBuffer
+from db_config import get_backend, get_connection, seed_products
+
+bp = Blueprint("store", __name__)
+
+DEFAULT_CONFIG = {
+    "COMPRESS_MIN_SIZE": int(os.getenv("COMPRESS_MIN_SIZE", "1024")),
+    "PRELOAD": os.getenv("PRELOAD", "") == "1"
+}
 
 DEMO_PRODUCTS = [
     {"id": 1, "name": "Stainless Steel Water Bottle", "price": 699.0, "stock": 44, "category": "Kitchen"},
@@ -19,6 +42,7 @@ DEMO_PRODUCTS = [
     {"id": 9, "name": "Kitchen Mixer Grinder", "price": 3699.0, "stock": 12, "category": "Appliances"},
 ]
 REQUESTED_PRODUCT_NAMES = {p["name"] for p in DEMO_PRODUCTS}
+DEMO_CATALOG = CatalogStore(DEMO_PRODUCTS)
 PRODUCT_IMAGE_FILES = {
     "Stainless Steel Water Bottle": "stainless_steel_water_bottle.svg",
     "Wireless Gaming Mouse": "wireless_gaming_mouse.svg",
@@ -38,6 +62,40 @@ UI_STATE = {
     "demo_logs": [],
     "pending_decisions": []
 }
+UI_LOCK = threading.Lock()
+
+
+def _restore_ui_state():
+    # Called by the write-behind worker, and retried with backoff until the DB is reachable.
+    ensure_ui_state_table()
+    rows = load_ui_state()
+
+    with UI_LOCK:
+        for kind, product_id, value in rows:
+            if (kind, product_id) in UI_WRITES:
+                # Changed in memory while the DB was unreachable: the newer local value wins.
+                continue
+            if kind == "like" and value:
+                UI_STATE["likes"].add(product_id)
+            elif kind == "wishlist" and value:
+                UI_STATE["wishlist"].add(product_id)
+            elif kind == "cart" and value > 0:
+                UI_STATE["cart"][product_id] = value
+
+
+UI_WRITES = WriteBehindBuffer(
+    persist_ui_state,
+    interval=float(os.getenv("WRITE_BEHIND_INTERVAL", "1.0")),
+    max_batch=int(os.getenv("WRITE_BEHIND_BATCH", "500")),
+    prepare_fn=_restore_ui_state
+)
+STORAGE = {"prepared": False}
+STORAGE_LOCK = threading.Lock()
+HEAVY_CALLS = SingleFlight()
+HEAVY_LIMITER = TokenBucketLimiter(
+    rate=float(os.getenv("HEAVY_RATE_PER_SECOND", "0.5")),
+    capacity=int(os.getenv("HEAVY_BURST", "3"))
+)
 
 
 def _db_is_available():
@@ -49,38 +107,79 @@ def _db_is_available():
         return False
 
 
+def _catalog_etag(scope):
+    # One round trip doubles as the availability probe: if it fails, the response is built in demo mode.
+    try:
+        # Keyed on the forecast state the body is built from, not on the newest sale, which a
+        # throttled forecast may not have seen yet.
+        db_version = (get_catalog_version(), forecast_version())
+    except Exception:
+        db_version = None
+    with UI_LOCK:
+        ui_state = (
+            sorted(UI_STATE["likes"]),
+            sorted(UI_STATE["wishlist"]),
+            sorted(UI_STATE["cart"].items())
+        )
+    # Derived from the state itself, so it cannot miss a concurrent update.
+    key = repr((scope, asset_revision(), DEMO_CATALOG.version, ui_state, db_version))
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]
+
+
+def _not_modified(etag):
+    if not etag:
+        return None
+    for candidate in encoding_etags(etag):
+        if candidate in request.if_none_match:
+            response = current_app.response_class(status=304)
+            response.set_etag(candidate)
+            response.headers["Cache-Control"] = "no-cache"
+            return response
+    return None
+
+
+def _with_etag(response, etag):
+    if etag:
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
 def _competitor_price(price, product_id):
     gap_factor = ((product_id * 17) % 21 - 10) / 100
     return round(price * (1 + gap_factor), 2)
 
 
+def _normalize_product(row):
+    product_id = int(row.get("id"))
+    return {
+        "id": product_id,
+        "name": row.get("name", f"Product {product_id}"),
+        "price": float(row.get("price", 0)),
+        "stock": int(row.get("stock", 0)),
+        "category": row.get("category", "General")
+    }
+
+
 def _normalize_products(rows):
-    normalized = []
-    for row in rows:
-        product_id = int(row.get("id"))
-        normalized.append({
-            "id": product_id,
-            "name": row.get("name", f"Product {product_id}"),
-            "price": float(row.get("price", 0)),
-            "stock": int(row.get("stock", 0)),
-            "category": row.get("category", "General")
-        })
-    return normalized
+    return [_normalize_product(row) for row in rows]
 
 
 def _get_products():
-    if _db_is_available():
+    try:
         db_products = _normalize_products(get_all_products())
-        filtered = [p for p in db_products if p["name"] in REQUESTED_PRODUCT_NAMES]
-        if filtered:
-            return filtered, "db"
-    return [dict(p) for p in DEMO_PRODUCTS], "demo"
+    except Exception:
+        db_products = []
+    filtered = [p for p in db_products if p["name"] in REQUESTED_PRODUCT_NAMES]
+    if filtered:
+        return ProductRows(filtered), "db"
+    return DEMO_CATALOG.snapshot(), "demo"
 
 
 def _trend_for_product(product, source):
     if source == "db":
         try:
-            return get_sales_trend(product["id"])
+            return get_forecast(product["id"])["trend"]
         except Exception:
             pass
 
@@ -95,41 +194,65 @@ def _trend_for_product(product, source):
 def _demand_for_product(product, source):
     if source == "db":
         try:
-            trend = get_sales_trend(product["id"])
-            if trend == "up":
-                return 82
-            if trend == "down":
-                return 34
-            return 56
+            return get_forecast(product["id"])["demand"]
         except Exception:
             pass
     return max(20, min(95, 100 - product["stock"] + ((product["id"] * 11) % 21)))
 
 
+def _velocity_for_product(product, source):
+    if source == "db":
+        try:
+            return get_forecast(product["id"])["velocity"]
+        except Exception:
+            pass
+    return None
+
+
 def _product_image_url(product_name, product_id):
     filename = PRODUCT_IMAGE_FILES.get(str(product_name), f"product_{int(product_id)}.svg")
-    return f"/static/images/{filename}"
+    return asset_url(f"images/{filename}")
+
+
+def _enrich_product(p, source):
+    competitor = _competitor_price(p["price"], p["id"])
+    demand = _demand_for_product(p, source)
+    trend = _trend_for_product(p, source)
+    cart_qty = int(UI_STATE["cart"].get(p["id"], 0))
+    return {
+        **p,
+        "demand": demand,
+        "sales_trend": trend,
+        "competitor_price": competitor,
+        "price_gap_percent": 0 if p["price"] == 0 else round(((p["price"] - competitor) / p["price"]) * 100, 2),
+        "liked": p["id"] in UI_STATE["likes"],
+        "wishlisted": p["id"] in UI_STATE["wishlist"],
+        "cart_qty": cart_qty,
+        "image_url": _product_image_url(p["name"], p["id"])
+    }
 
 
 def _enrich_products(products, source):
-    enriched = []
-    for p in products:
-        competitor = _competitor_price(p["price"], p["id"])
-        demand = _demand_for_product(p, source)
-        trend = _trend_for_product(p, source)
-        cart_qty = int(UI_STATE["cart"].get(p["id"], 0))
-        enriched.append({
-            **p,
-            "demand": demand,
-            "sales_trend": trend,
-            "competitor_price": competitor,
-            "price_gap_percent": 0 if p["price"] == 0 else round(((p["price"] - competitor) / p["price"]) * 100, 2),
-            "liked": p["id"] in UI_STATE["likes"],
-            "wishlisted": p["id"] in UI_STATE["wishlist"],
-            "cart_qty": cart_qty,
-            "image_url": _product_image_url(p["name"], p["id"])
-        })
-    return enriched
+    return [_enrich_product(p, source) for p in products]
+
+
+def _business_signal(product, source):
+    stock = int(product["stock"])
+    price = float(product["price"])
+    rival_price = _competitor_price(price, int(product["id"]))
+    trend = _trend_for_product(product, source)
+    stock_risk = "high" if stock <= 5 else ("medium" if stock <= 15 else "low")
+    return {
+        "product_id": int(product["id"]),
+        "name": product["name"],
+        "sales_trend": trend,
+        "stock_risk": stock_risk,
+        "stock": stock,
+        "demand": _demand_for_product(product, source),
+        "velocity": _velocity_for_product(product, source),
+        "price_gap": round(price - rival_price, 2),
+        "source": source
+    }
 
 
 def _build_cart_summary(enriched_products):
@@ -225,8 +348,6 @@ def _apply_agent_decisions(source):
     if not decisions:
         return []
 
-    by_id = {p["id"]: p for p in DEMO_PRODUCTS}
-
     if source == "db":
         conn = get_connection()
         cursor = conn.cursor()
@@ -242,9 +363,7 @@ def _apply_agent_decisions(source):
             if source == "db":
                 cursor.execute("UPDATE products SET price=%s WHERE id=%s", (after_price, product_id))
             else:
-                target = by_id.get(product_id)
-                if target:
-                    target["price"] = after_price
+                DEMO_CATALOG.set_price(product_id, after_price)
 
         log = {
             **decision,
@@ -278,32 +397,57 @@ def _apply_agent_decisions(source):
     return applied
 
 
-@app.route("/")
+@bp.route("/")
 def index():
     return render_template("index.html")
 
 
-@app.route("/store-data")
+@bp.route("/assets/<path:fingerprint>")
+def assets(fingerprint):
+    asset = get_asset(fingerprint)
+    if not asset:
+        abort(404)
+
+    body, encoding = asset_body(asset, request.accept_encodings)
+    response = current_app.response_class(body, mimetype=asset["mimetype"])
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+@bp.route("/store-data")
 def store_data():
+    etag = _catalog_etag("store-data")
+    cached = _not_modified(etag)
+    if cached:
+        return cached
+
     products, source = _get_products()
     enriched = _enrich_products(products, source)
-    return jsonify({
+    return _with_etag(jsonify({
         "ok": True,
         "source": source,
         "products": enriched,
         "cart": _build_cart_summary(enriched),
         "wishlist_count": len(UI_STATE["wishlist"]),
         "likes_count": len(UI_STATE["likes"])
-    })
+    }), etag)
 
 
-@app.route("/products")
+@bp.route("/products")
 def products():
+    etag = _catalog_etag("products")
+    cached = _not_modified(etag)
+    if cached:
+        return cached
+
     products_data, source = _get_products()
-    return jsonify(_enrich_products(products_data, source))
+    return _with_etag(jsonify(_enrich_products(products_data, source)), etag)
 
 
-@app.route("/competitor-prices")
+@bp.route("/competitor-prices")
 def competitor_prices():
     products_data, source = _get_products()
     comparison = []
@@ -322,30 +466,14 @@ def competitor_prices():
     return jsonify({"ok": True, "data": comparison})
 
 
-@app.route("/business-signals")
+@bp.route("/business-signals")
 def business_signals():
     products_data, source = _get_products()
-    signals = []
-    for product in products_data:
-        stock = int(product["stock"])
-        price = float(product["price"])
-        rival_price = _competitor_price(price, int(product["id"]))
-        trend = _trend_for_product(product, source)
-        stock_risk = "high" if stock <= 5 else ("medium" if stock <= 15 else "low")
-        signals.append({
-            "product_id": int(product["id"]),
-            "name": product["name"],
-            "sales_trend": trend,
-            "stock_risk": stock_risk,
-            "stock": stock,
-            "demand": _demand_for_product(product, source),
-            "price_gap": round(price - rival_price, 2),
-            "source": source
-        })
+    signals = [_business_signal(product, source) for product in products_data]
     return jsonify({"ok": True, "data": signals})
 
 
-@app.route("/strategy-preview")
+@bp.route("/strategy-preview")
 def strategy_preview():
     products_data, source = _get_products()
     plans = []
@@ -375,73 +503,88 @@ def strategy_preview():
     return jsonify({"ok": True, "data": plans})
 
 
-@app.route("/simulate-sales")
-def simulate():
+def _simulate_sales():
     products_data, source = _get_products()
     if source == "db":
         try:
-            return jsonify({"ok": True, "message": simulate_sales(), "source": source})
+            return {"ok": True, "message": simulate_sales(), "source": source}, 200
         except Exception as e:
-            return jsonify({"ok": False, "error": "simulate_sales_failed", "message": str(e)}), 500
+            return {"ok": False, "error": "simulate_sales_failed", "message": str(e)}, 500
 
-    for p in DEMO_PRODUCTS:
+    for product_id in DEMO_CATALOG.product_ids():
         swing = random.randint(-2, 4)
-        p["stock"] = max(1, p["stock"] - max(0, swing))
-    return jsonify({"ok": True, "message": "Sales simulated successfully (demo mode)", "source": source})
+        DEMO_CATALOG.adjust_stock(product_id, -max(0, swing), floor=1)
+    return {"ok": True, "message": "Sales simulated successfully (demo mode)", "source": source}, 200
 
 
-@app.route("/toggle-like", methods=["POST"])
+@bp.route("/simulate-sales")
+@rate_limited(HEAVY_LIMITER)
+def simulate():
+    payload, status_code = HEAVY_CALLS.do("simulate-sales", _simulate_sales)
+    return jsonify(payload), status_code
+
+
+@bp.route("/toggle-like", methods=["POST"])
 def toggle_like():
     payload = request.get_json(silent=True) or {}
     product_id = int(payload.get("product_id", 0))
-    if product_id in UI_STATE["likes"]:
-        UI_STATE["likes"].remove(product_id)
-        liked = False
-    else:
-        UI_STATE["likes"].add(product_id)
-        liked = True
+    with UI_LOCK:
+        if product_id in UI_STATE["likes"]:
+            UI_STATE["likes"].remove(product_id)
+            liked = False
+        else:
+            UI_STATE["likes"].add(product_id)
+            liked = True
+        UI_WRITES.put(("like", product_id), int(liked))
     return jsonify({"ok": True, "product_id": product_id, "liked": liked})
 
 
-@app.route("/wishlist/toggle", methods=["POST"])
+@bp.route("/wishlist/toggle", methods=["POST"])
 def toggle_wishlist():
     payload = request.get_json(silent=True) or {}
     product_id = int(payload.get("product_id", 0))
-    if product_id in UI_STATE["wishlist"]:
-        UI_STATE["wishlist"].remove(product_id)
-        wishlisted = False
-    else:
-        UI_STATE["wishlist"].add(product_id)
-        wishlisted = True
+    with UI_LOCK:
+        if product_id in UI_STATE["wishlist"]:
+            UI_STATE["wishlist"].remove(product_id)
+            wishlisted = False
+        else:
+            UI_STATE["wishlist"].add(product_id)
+            wishlisted = True
+        UI_WRITES.put(("wishlist", product_id), int(wishlisted))
     return jsonify({"ok": True, "product_id": product_id, "wishlisted": wishlisted})
 
 
-@app.route("/cart/add", methods=["POST"])
+@bp.route("/cart/add", methods=["POST"])
 def cart_add():
     payload = request.get_json(silent=True) or {}
     product_id = int(payload.get("product_id", 0))
     quantity = max(1, int(payload.get("quantity", 1)))
-    UI_STATE["cart"][product_id] = int(UI_STATE["cart"].get(product_id, 0)) + quantity
-    return jsonify({"ok": True, "product_id": product_id, "quantity": UI_STATE["cart"][product_id]})
+    with UI_LOCK:
+        cart_qty = int(UI_STATE["cart"].get(product_id, 0)) + quantity
+        UI_STATE["cart"][product_id] = cart_qty
+        UI_WRITES.put(("cart", product_id), cart_qty)
+    return jsonify({"ok": True, "product_id": product_id, "quantity": cart_qty})
 
 
-@app.route("/cart/remove", methods=["POST"])
+@bp.route("/cart/remove", methods=["POST"])
 def cart_remove():
     payload = request.get_json(silent=True) or {}
     product_id = int(payload.get("product_id", 0))
-    if product_id in UI_STATE["cart"]:
-        del UI_STATE["cart"][product_id]
+    with UI_LOCK:
+        if product_id in UI_STATE["cart"]:
+            del UI_STATE["cart"][product_id]
+        UI_WRITES.put(("cart", product_id), 0)
     return jsonify({"ok": True, "product_id": product_id})
 
 
-@app.route("/cart")
+@bp.route("/cart")
 def cart():
     products_data, source = _get_products()
     enriched = _enrich_products(products_data, source)
     return jsonify({"ok": True, "cart": _build_cart_summary(enriched)})
 
 
-@app.route("/simulate-purchase", methods=["POST"])
+@bp.route("/simulate-purchase", methods=["POST"])
 def simulate_purchase():
     payload = request.get_json(silent=True) or {}
 
@@ -452,7 +595,7 @@ def simulate_purchase():
         return jsonify({"ok": False, "error": "invalid_payload", "message": "product_id and quantity must be numbers"}), 400
 
     products_data, source = _get_products()
-    product = next((p for p in products_data if int(p["id"]) == product_id), None)
+    product = products_data.get(product_id)
     if not product:
         return jsonify({"ok": False, "error": "product_not_found"}), 404
 
@@ -471,12 +614,12 @@ def simulate_purchase():
         except Exception as e:
             return jsonify({"ok": False, "error": "purchase_simulation_failed", "message": str(e)}), 500
     else:
-        for p in DEMO_PRODUCTS:
-            if p["id"] == product_id:
-                p["stock"] = max(0, p["stock"] - quantity)
-                break
+        DEMO_CATALOG.adjust_stock(product_id, -quantity)
 
-    UI_STATE["cart"][product_id] = max(0, int(UI_STATE["cart"].get(product_id, 0)) - quantity)
+    with UI_LOCK:
+        cart_qty = max(0, int(UI_STATE["cart"].get(product_id, 0)) - quantity)
+        UI_STATE["cart"][product_id] = cart_qty
+        UI_WRITES.put(("cart", product_id), cart_qty)
 
     unit_price = float(product["price"])
     return jsonify({
@@ -493,10 +636,15 @@ def simulate_purchase():
     })
 
 
-@app.route("/run-agent")
-def run():
+def _run_agent_analysis():
     products_data, source = _get_products()
-    decisions = _analyze_agent(products_data, source)
+    return _analyze_agent(products_data, source)
+
+
+@bp.route("/run-agent")
+@rate_limited(HEAVY_LIMITER)
+def run():
+    decisions = HEAVY_CALLS.do("run-agent", _run_agent_analysis)
     return jsonify({
         "ok": True,
         "stage": "analysis",
@@ -505,7 +653,7 @@ def run():
     })
 
 
-@app.route("/apply-agent-decisions", methods=["POST"])
+@bp.route("/apply-agent-decisions", methods=["POST"])
 def apply_agent_decisions():
     _, source = _get_products()
     try:
@@ -528,7 +676,7 @@ def apply_agent_decisions():
     })
 
 
-@app.route("/agent-state")
+@bp.route("/agent-state")
 def agent_state():
     pending = UI_STATE.get("pending_decisions", [])
     return jsonify({
@@ -538,7 +686,7 @@ def agent_state():
     })
 
 
-@app.route("/agent-logs")
+@bp.route("/agent-logs")
 def agent_logs():
     limit = int(request.args.get("limit", 30))
     limit = max(1, min(limit, 100))
@@ -558,7 +706,53 @@ def agent_logs():
     return jsonify({"ok": True, "data": UI_STATE["demo_logs"][:limit], "source": "demo"})
 
 
-@app.route("/health")
+def _iter_export_products():
+    if _db_is_available():
+        for row in iter_products():
+            yield _normalize_product(row), "db"
+    else:
+        for p in DEMO_CATALOG.snapshot():
+            yield p, "demo"
+
+
+def _export_response(rows, filename, fieldnames):
+    export_format = request.args.get("format", "ndjson").lower()
+    if export_format == "csv":
+        lines = csv_lines(rows, fieldnames)
+        mimetype = "text/csv"
+    elif export_format == "ndjson":
+        lines = ndjson_lines(rows, current_app.json.dumps)
+        mimetype = "application/x-ndjson"
+    else:
+        return jsonify({"ok": False, "error": "invalid_format", "message": "format must be ndjson or csv"}), 400
+
+    response = Response(stream_with_context(lines), mimetype=mimetype)
+    response.headers["Content-Disposition"] = f"attachment; filename={filename}.{export_format}"
+    return response
+
+
+@bp.route("/export/products")
+def export_products():
+    rows = (_enrich_product(product, source) for product, source in _iter_export_products())
+    return _export_response(rows, "products", PRODUCT_EXPORT_FIELDS)
+
+
+@bp.route("/export/business-signals")
+def export_business_signals():
+    rows = (_business_signal(product, source) for product, source in _iter_export_products())
+    return _export_response(rows, "business_signals", SIGNAL_EXPORT_FIELDS)
+
+
+@bp.route("/export/agent-logs")
+def export_agent_logs():
+    if _db_is_available():
+        rows = iter_agent_logs()
+    else:
+        rows = iter(list(UI_STATE["demo_logs"]))
+    return _export_response(rows, "agent_logs", AGENT_LOG_EXPORT_FIELDS)
+
+
+@bp.route("/health")
 def health():
     db_ok = _db_is_available()
     api_key_ok = bool(os.getenv("OPENROUTER_API_KEY", "").strip())
@@ -569,10 +763,55 @@ def health():
         "mode": data_source,
         "services": {
             "database": {"ok": db_ok},
-            "openrouter_api_key": {"ok": api_key_ok}
+            "openrouter_api_key": {"ok": api_key_ok},
+            "ui_state_persistence": {"ok": UI_WRITES.ready, "pending": len(UI_WRITES)}
         }
     }), status_code
 
 
+def _prepare_storage():
+    # Runs on the first request of each process rather than in create_app, so importing
+    # the app (or forking gunicorn workers from it) never opens a DB connection.
+    if STORAGE["prepared"]:
+        return
+    with STORAGE_LOCK:
+        if STORAGE["prepared"]:
+            return
+        if get_backend() == "sqlite":
+            try:
+                seed_products(DEMO_PRODUCTS)
+            except Exception:
+                pass
+        # Restores UI state in the background; a DB outage only delays it.
+        UI_WRITES.start()
+        STORAGE["prepared"] = True
+
+
+def preload():
+    # Work every worker would otherwise repeat on its first request; no connection is opened.
+    if get_backend() == "mysql":
+        import mysql.connector  # noqa: F401
+    load_assets()
+
+
+def create_app(config=None):
+    app = Flask(__name__)
+    app.config.update(DEFAULT_CONFIG)
+    app.config.update(config or {})
+
+    app.json = FastJSONProvider(app)
+    app.before_request(_prepare_storage)
+    app.after_request(compress_response)
+    app.jinja_env.globals["asset_url"] = asset_url
+    app.register_blueprint(bp)
+    # Served from static/dist when `python -m services.asset_service build` has been run,
+    # otherwise built in memory on first use.
+    init_assets(app.static_folder)
+
+    if app.config["PRELOAD"]:
+        preload()
+    return app
+
+
 if __name__ == "__main__":
-    app.run(debug=True)
+    create_app().run(debug=True)
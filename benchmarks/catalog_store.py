@@ -0,0 +1,43 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.catalog_store import CatalogStore  # noqa: E402
+
+
+ROWS = int(os.getenv("CATALOG_ROWS", "1000000"))
+ROUNDS = int(os.getenv("CATALOG_ROUNDS", "1000"))
+
+
+def timed(label, fn):
+    started = time.perf_counter()
+    result = fn()
+    print(f"{label}: {(time.perf_counter() - started) * 1000:.2f} ms")
+    return result
+
+
+def main():
+    store = timed(f"synthetic({ROWS})", lambda: CatalogStore.synthetic(ROWS))
+    step = max(1, ROWS // ROUNDS)
+
+    def snapshot_then_write():
+        for i in range(ROUNDS):
+            store.snapshot()
+            store.set_price(1 + (i * step) % ROWS, 10.0)
+            store.adjust_stock(1 + (i * step) % ROWS, -1)
+
+    def writes_only():
+        for i in range(ROUNDS):
+            store.set_price(1 + (i * step) % ROWS, 10.0)
+            store.adjust_stock(1 + (i * step) % ROWS, -1)
+
+    timed(f"{ROUNDS} x (snapshot + set_price + adjust_stock)", snapshot_then_write)
+    timed(f"{ROUNDS} x (set_price + adjust_stock)", writes_only)
+    snapshot = store.snapshot()
+    timed("iterate full snapshot", lambda: sum(1 for _ in snapshot))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = int(os.getenv("STARTUP_RUNS", "15"))
+
+
+def _git(*args):
+    return subprocess.run(["git", *args], cwd=ROOT, check=True, capture_output=True).stdout
+
+
+def baseline_tree(target):
+    # The pre-factory app.py imported mysql.connector at module load, so it has to be
+    # measured from its own tree, not by importing today's modules differently.
+    ref = os.getenv("STARTUP_BASELINE_REF") or _git("rev-list", "--max-parents=0", "HEAD").decode().split()[0]
+    archive = os.path.join(target, "baseline.tar")
+    with open(archive, "wb") as f:
+        f.write(_git("archive", ref))
+    with tarfile.open(archive) as tar:
+        tar.extractall(os.path.join(target, "baseline"))
+    return os.path.join(target, "baseline"), ref
+
+
+def measure(code, cwd):
+    timings = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=cwd, check=True)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        baseline_root, ref = baseline_tree(tmp)
+        scenarios = [
+            ("interpreter only", "pass", ROOT),
+            (f"baseline `import app` ({ref[:7]})", "import app", baseline_root),
+            ("create_app()", "import app; app.create_app()", ROOT),
+            ("create_app() + PRELOAD", "import app; app.create_app({'PRELOAD': True})", ROOT),
+            # DB setup and the asset load moved to first use; count them here so they are not hidden.
+            ("create_app() + first request", "import app; app.create_app().test_client().get('/')", ROOT),
+        ]
+        for name, code, cwd in scenarios:
+            print(f"{name}: {measure(code, cwd):.1f} ms (median of {RUNS})")
+
+
+if __name__ == "__main__":
+    main()
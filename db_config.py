@@ -1,7 +1,194 @@
 import os
-import mysql.connector
+import sqlite3
+import threading
+from functools import lru_cache
 
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    price REAL NOT NULL DEFAULT 0,
+    stock INTEGER NOT NULL DEFAULT 0,
+    category TEXT NOT NULL DEFAULT 'General'
+);
+
+CREATE TABLE IF NOT EXISTS sales (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    product_id INTEGER NOT NULL,
+    quantity INTEGER NOT NULL,
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_sales_product_id ON sales (product_id);
+
+-- agent_logs.id is the rowid, so ORDER BY id DESC walks the primary key index.
+CREATE TABLE IF NOT EXISTS agent_logs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    product_id INTEGER NOT NULL,
+    problem TEXT,
+    action TEXT,
+    action_value REAL,
+    reason TEXT,
+    before_price REAL,
+    after_price REAL,
+    success INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS ui_state (
+    kind TEXT NOT NULL,
+    product_id INTEGER NOT NULL,
+    value INTEGER NOT NULL,
+    PRIMARY KEY (kind, product_id)
+);
+"""
+
+MYSQL_UI_STATE_DDL = """
+CREATE TABLE IF NOT EXISTS ui_state (
+    kind VARCHAR(16) NOT NULL,
+    product_id INT NOT NULL,
+    value INT NOT NULL,
+    PRIMARY KEY (kind, product_id)
+)
+"""
+
+# Added once by the forecast service. Existing rows stay NULL (unknown time) instead of all
+# being stamped with the time of the ALTER, which would look like one huge burst of sales.
+MYSQL_SALES_TIME_DDL = """
+ALTER TABLE sales ADD COLUMN {column} TIMESTAMP NULL DEFAULT NULL
+"""
+MYSQL_SALES_TIME_DEFAULT_DDL = """
+ALTER TABLE sales MODIFY COLUMN {column} TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP
+"""
+
+_SQLITE_POOL = threading.local()
+# Handles inherited across fork are parked here, never reused or closed, in the child.
+_SQLITE_INHERITED = []
+
+
+def get_backend():
+    return os.getenv("DB_BACKEND", "mysql").strip().lower()
+
+
+# -----------------------------
+# SQLITE ADAPTER
+# -----------------------------
+@lru_cache(maxsize=256)
+def _sqlite_query(query):
+    return query.replace("%s", "?")
+
+
+class SqliteCursor:
+    def __init__(self, cursor, dictionary=False):
+        self._cursor = cursor
+        self._dictionary = dictionary
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    def execute(self, query, params=()):
+        self._cursor.execute(_sqlite_query(query), tuple(params))
+        return self
+
+    def _convert(self, row):
+        if row is None or not self._dictionary:
+            return row
+        columns = [col[0] for col in self._cursor.description]
+        return dict(zip(columns, row))
+
+    def fetchone(self):
+        return self._convert(self._cursor.fetchone())
+
+    def fetchmany(self, size=1):
+        return [self._convert(row) for row in self._cursor.fetchmany(size)]
+
+    def fetchall(self):
+        return [self._convert(row) for row in self._cursor.fetchall()]
+
+    def close(self):
+        self._cursor.close()
+
+
+class SqliteConnection:
+    def __init__(self, conn):
+        self._conn = conn
+        self._closed = False
+
+    def cursor(self, dictionary=False, **kwargs):
+        return SqliteCursor(self._conn.cursor(), dictionary=dictionary)
+
+    def commit(self):
+        self._conn.commit()
+
+    def rollback(self):
+        self._conn.rollback()
+
+    def close(self):
+        # Like MySQL, uncommitted work is discarded; the handle goes back to this
+        # thread's pool so its prepared statement cache survives between requests.
+        # Each checkout gets its own wrapper, so closing it twice cannot pool the handle twice.
+        if self._closed:
+            return
+        self._closed = True
+        self._conn.rollback()
+        _SQLITE_POOL.idle.append(self._conn)
+
+    def discard(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._conn.close()
+
+
+def _open_sqlite():
+    conn = sqlite3.connect(os.getenv("SQLITE_PATH", "ecommerce_agent.db"), cached_statements=256)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SQLITE_SCHEMA)
+    return conn
+
+
+def _get_sqlite_connection():
+    if getattr(_SQLITE_POOL, "pid", None) != os.getpid():
+        # SQLite handles must not cross fork(): a pre-forked worker starts with an empty pool.
+        _SQLITE_INHERITED.extend(getattr(_SQLITE_POOL, "idle", []))
+        _SQLITE_POOL.idle = []
+        _SQLITE_POOL.pid = os.getpid()
+    if _SQLITE_POOL.idle:
+        return SqliteConnection(_SQLITE_POOL.idle.pop())
+    return SqliteConnection(_open_sqlite())
+
+
+def seed_products(products):
+    conn = _get_sqlite_connection()
+    cursor = conn.cursor()
+
+    cursor.execute("SELECT COUNT(*) FROM products")
+    if cursor.fetchone()[0] == 0:
+        for p in products:
+            cursor.execute(
+                "INSERT INTO products (id, name, price, stock, category) VALUES (%s, %s, %s, %s, %s)",
+                (p["id"], p["name"], p["price"], p["stock"], p["category"])
+            )
+        conn.commit()
+
+    conn.close()
+
+
+# -----------------------------
+# CONNECTION
+# -----------------------------
 def get_connection():
+    if get_backend() == "sqlite":
+        return _get_sqlite_connection()
+
+    import mysql.connector
+
     db_host = os.getenv("DB_HOST", "localhost")
     db_user = os.getenv("DB_USER", "root")
     db_password = os.getenv("DB_PASSWORD", "")
@@ -0,0 +1,12 @@
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+
+# UI_STATE (cart, likes, pending agent decisions), the demo catalogue and the rate limiter
+# live in process memory, so a single worker with threads keeps them consistent.
+workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+
+# Build the app (assets, DB driver, LLM client module) once in the master and fork workers from it.
+preload_app = True
+wsgi_app = "app:create_app({'PRELOAD': True})"
@@ -1,5 +1,4 @@
 import os
-import requests
 import json
 from db_config import get_connection
 from services.sales_service import get_sales_trend
@@ -48,6 +47,8 @@ def get_decision(context):
     """
 
     try:
+        import requests
+
         response = requests.post(
             "https://openrouter.ai/api/v1/chat/completions",
             headers={
@@ -0,0 +1,212 @@
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import sys
+import threading
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+ASSET_EXTENSIONS = (".css", ".js", ".svg")
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+DIST_DIR = "dist"
+MANIFEST_NAME = "manifest.json"
+
+ASSETS = {
+    "by_logical": {},
+    "by_fingerprint": {},
+    "revision": "",
+    "static_folder": None,
+    "loaded": False
+}
+_LOCK = threading.Lock()
+
+
+# -----------------------------
+# 1. MINIFY
+# -----------------------------
+def _minify_css(text):
+    text = re.sub(r"/\*.*?\*/", "", text, flags=re.S)
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r"\s*([{};,>])\s*", r"\1", text)
+    text = re.sub(r":\s+", ":", text)
+    return text.replace(";}", "}").strip()
+
+
+def _minify_svg(text):
+    text = re.sub(r"<!--.*?-->", "", text, flags=re.S)
+    text = re.sub(r">\s+<", "><", text)
+    return text.strip()
+
+
+def minify(filename, body):
+    if filename.endswith(".css"):
+        return _minify_css(body.decode("utf-8")).encode("utf-8")
+    if filename.endswith(".svg"):
+        return _minify_svg(body.decode("utf-8")).encode("utf-8")
+    # JS is shipped as-is: template literals in app.js make whitespace significant.
+    return body
+
+
+# -----------------------------
+# 2. BUILD
+# -----------------------------
+def _fingerprint(filename, body):
+    digest = hashlib.sha256(body).hexdigest()[:12]
+    root, ext = os.path.splitext(filename)
+    return f"{root}.{digest}{ext}"
+
+
+def _revision(fingerprints):
+    return hashlib.sha256("".join(sorted(fingerprints)).encode("utf-8")).hexdigest()[:12]
+
+
+def _sources(static_folder):
+    for dirpath, dirnames, filenames in os.walk(static_folder):
+        if dirpath == static_folder and DIST_DIR in dirnames:
+            dirnames.remove(DIST_DIR)
+        for name in sorted(filenames):
+            if name.endswith(ASSET_EXTENSIONS):
+                path = os.path.join(dirpath, name)
+                yield os.path.relpath(path, static_folder).replace(os.sep, "/"), path
+
+
+def build_assets(static_folder):
+    by_logical = {}
+    for logical, path in _sources(static_folder):
+        with open(path, "rb") as f:
+            body = minify(logical, f.read())
+
+        by_logical[logical] = {
+            "logical": logical,
+            "fingerprint": _fingerprint(logical, body),
+            "mimetype": mimetypes.guess_type(logical)[0] or "application/octet-stream",
+            "identity": body,
+            "gzip": gzip.compress(body, compresslevel=9, mtime=0),
+            "br": brotli.compress(body, quality=11) if brotli is not None else None
+        }
+    return by_logical
+
+
+def write_dist(static_folder):
+    by_logical = build_assets(static_folder)
+    dist = os.path.join(static_folder, DIST_DIR)
+    os.makedirs(dist, exist_ok=True)
+
+    manifest = {"revision": _revision(a["fingerprint"] for a in by_logical.values()), "assets": {}}
+    for logical, asset in by_logical.items():
+        for suffix, key in (("", "identity"), (".gz", "gzip"), (".br", "br")):
+            if asset[key] is None:
+                continue
+            path = os.path.join(dist, asset["fingerprint"] + suffix)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(asset[key])
+        manifest["assets"][logical] = {
+            "fingerprint": asset["fingerprint"],
+            "mimetype": asset["mimetype"],
+            "br": asset["br"] is not None
+        }
+
+    # Written last, so a manifest on disk always points at complete files.
+    with open(os.path.join(dist, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+def _read_dist(static_folder):
+    dist = os.path.join(static_folder, DIST_DIR)
+    manifest_path = os.path.join(dist, MANIFEST_NAME)
+    try:
+        built_at = os.stat(manifest_path).st_mtime
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    # A manifest older than any source file (or missing one) is stale: rebuild instead.
+    sources = dict(_sources(static_folder))
+    if set(sources) != set(manifest["assets"]):
+        return None
+    if any(os.stat(path).st_mtime > built_at for path in sources.values()):
+        return None
+
+    by_logical = {}
+    for logical, entry in manifest["assets"].items():
+        asset = {"logical": logical, "fingerprint": entry["fingerprint"], "mimetype": entry["mimetype"], "br": None}
+        for suffix, key in (("", "identity"), (".gz", "gzip"), (".br", "br")):
+            if key == "br" and not (entry["br"] and brotli is not None):
+                continue
+            with open(os.path.join(dist, entry["fingerprint"] + suffix), "rb") as f:
+                asset[key] = f.read()
+        by_logical[logical] = asset
+    return by_logical
+
+
+def init_assets(static_folder):
+    # Only records where the assets live; they are loaded on first use (or by preload).
+    with _LOCK:
+        ASSETS["static_folder"] = static_folder
+        ASSETS["loaded"] = False
+
+
+def load_assets():
+    if ASSETS["loaded"]:
+        return ASSETS
+    with _LOCK:
+        if ASSETS["loaded"]:
+            return ASSETS
+        static_folder = ASSETS["static_folder"]
+        by_logical = {}
+        if static_folder:
+            by_logical = _read_dist(static_folder)
+            if by_logical is None:
+                by_logical = build_assets(static_folder)
+
+        ASSETS["by_logical"] = by_logical
+        ASSETS["by_fingerprint"] = {a["fingerprint"]: a for a in by_logical.values()}
+        ASSETS["revision"] = _revision(ASSETS["by_fingerprint"])
+        ASSETS["loaded"] = True
+    return ASSETS
+
+
+# -----------------------------
+# 3. LOOKUP
+# -----------------------------
+def asset_revision():
+    return load_assets()["revision"]
+
+
+def asset_url(filename):
+    asset = load_assets()["by_logical"].get(filename)
+    if not asset:
+        return f"/static/{filename}"
+    return f"/assets/{asset['fingerprint']}"
+
+
+def get_asset(fingerprint):
+    return load_assets()["by_fingerprint"].get(fingerprint)
+
+
+def asset_body(asset, accept_encodings):
+    if asset["br"] is not None and accept_encodings["br"]:
+        return asset["br"], "br"
+    if accept_encodings["gzip"]:
+        return asset["gzip"], "gzip"
+    return asset["identity"], None
+
+
+# Build step for deploys, so workers serve precompressed files instead of compressing on startup:
+#   python -m services.asset_service build [static_folder]
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != "build":
+        sys.exit("usage: python -m services.asset_service build [static_folder]")
+    folder = sys.argv[2] if len(sys.argv) > 2 else os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static")
+    built = write_dist(folder)
+    print(f"built {len(built['assets'])} assets into {os.path.join(folder, DIST_DIR)} (revision {built['revision']})")
@@ -0,0 +1,148 @@
+import random
+import threading
+from array import array
+
+
+SYNTHETIC_CATEGORIES = ["Kitchen", "Gaming", "Accessories", "Home", "Audio", "Wearables", "Fashion", "Appliances"]
+
+CHUNK_BITS = 12
+CHUNK_SIZE = 1 << CHUNK_BITS
+CHUNK_MASK = CHUNK_SIZE - 1
+
+
+def _chunked(typecode, values):
+    values = array(typecode, values)
+    return [values[start:start + CHUNK_SIZE] for start in range(0, len(values), CHUNK_SIZE)]
+
+
+# -----------------------------
+# 1. READ-ONLY SNAPSHOT
+# -----------------------------
+class CatalogSnapshot:
+    def __init__(self, ids, names, prices, stocks, categories, index):
+        self._ids = ids
+        self._names = names
+        self._prices = prices
+        self._stocks = stocks
+        self._categories = categories
+        self._index = index
+
+    def __len__(self):
+        return len(self._ids)
+
+    def _row(self, row):
+        chunk, offset = row >> CHUNK_BITS, row & CHUNK_MASK
+        return {
+            "id": self._ids[row],
+            "name": self._names[row],
+            "price": self._prices[chunk][offset],
+            "stock": self._stocks[chunk][offset],
+            "category": self._categories[row]
+        }
+
+    def __iter__(self):
+        for row in range(len(self._ids)):
+            yield self._row(row)
+
+    def get(self, product_id):
+        row = self._index.get(int(product_id))
+        if row is None:
+            return None
+        return self._row(row)
+
+
+class ProductRows(list):
+    def __init__(self, rows):
+        super().__init__(rows)
+        self._index = {int(p["id"]): p for p in self}
+
+    def get(self, product_id):
+        return self._index.get(int(product_id))
+
+
+# -----------------------------
+# 2. COLUMNAR STORE
+# -----------------------------
+class CatalogStore:
+    def __init__(self, products=()):
+        self._lock = threading.Lock()
+        self.version = 0
+        self.load(products)
+
+    @classmethod
+    def synthetic(cls, count, seed=0):
+        rng = random.Random(seed)
+        return cls(
+            {
+                "id": i,
+                "name": f"Product {i}",
+                "price": round(rng.uniform(99, 4999), 2),
+                "stock": rng.randint(0, 120),
+                "category": SYNTHETIC_CATEGORIES[i % len(SYNTHETIC_CATEGORIES)]
+            }
+            for i in range(1, count + 1)
+        )
+
+    def load(self, products):
+        products = list(products)
+        with self._lock:
+            self._ids = array("q", (int(p["id"]) for p in products))
+            self._names = [p["name"] for p in products]
+            self._categories = [p.get("category", "General") for p in products]
+            self._columns = {
+                "prices": _chunked("d", (float(p["price"]) for p in products)),
+                "stocks": _chunked("q", (int(p["stock"]) for p in products))
+            }
+            self._index = {product_id: row for row, product_id in enumerate(self._ids)}
+            # A chunk may be written in place only if no snapshot taken since it was copied can see it.
+            self._epoch = 0
+            self._chunk_epochs = {name: [0] * len(chunks) for name, chunks in self._columns.items()}
+            self.version += 1
+
+    def __len__(self):
+        return len(self._ids)
+
+    def _view(self, prices, stocks):
+        return CatalogSnapshot(self._ids, self._names, prices, stocks, self._categories, self._index)
+
+    def snapshot(self):
+        with self._lock:
+            # Copies only the chunk reference lists (len / CHUNK_SIZE entries), never the values.
+            self._epoch += 1
+            return self._view(list(self._columns["prices"]), list(self._columns["stocks"]))
+
+    def get(self, product_id):
+        with self._lock:
+            return self._view(self._columns["prices"], self._columns["stocks"]).get(product_id)
+
+    def product_ids(self):
+        return list(self._ids)
+
+    def _writable(self, column, row):
+        chunk = row >> CHUNK_BITS
+        chunks = self._columns[column]
+        epochs = self._chunk_epochs[column]
+        if epochs[chunk] != self._epoch:
+            chunks[chunk] = array(chunks[chunk].typecode, chunks[chunk])
+            epochs[chunk] = self._epoch
+        return chunks[chunk], row & CHUNK_MASK
+
+    def set_price(self, product_id, price):
+        with self._lock:
+            row = self._index.get(int(product_id))
+            if row is None:
+                return False
+            chunk, offset = self._writable("prices", row)
+            chunk[offset] = float(price)
+            self.version += 1
+            return True
+
+    def adjust_stock(self, product_id, delta, floor=0):
+        with self._lock:
+            row = self._index.get(int(product_id))
+            if row is None:
+                return None
+            chunk, offset = self._writable("stocks", row)
+            chunk[offset] = max(floor, chunk[offset] + int(delta))
+            self.version += 1
+            return chunk[offset]
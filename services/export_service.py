@@ -0,0 +1,72 @@
+import csv
+import io
+from db_config import get_connection
+
+
+EXPORT_BATCH_SIZE = 500
+
+PRODUCT_EXPORT_FIELDS = [
+    "id", "name", "price", "stock", "category", "demand", "sales_trend", "competitor_price",
+    "price_gap_percent", "liked", "wishlisted", "cart_qty", "image_url"
+]
+SIGNAL_EXPORT_FIELDS = [
+    "product_id", "name", "sales_trend", "stock_risk", "stock", "demand", "velocity", "price_gap", "source"
+]
+AGENT_LOG_EXPORT_FIELDS = [
+    "id", "product_id", "name", "problem", "action", "action_value", "reason", "before_price", "after_price",
+    "success", "created_at"
+]
+
+
+# -----------------------------
+# 1. SERVER-SIDE CURSOR
+# -----------------------------
+def iter_query(query, params=(), batch_size=EXPORT_BATCH_SIZE):
+    conn = get_connection()
+    cursor = None
+    try:
+        cursor = conn.cursor(dictionary=True)
+        cursor.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield row
+    finally:
+        # Runs on GeneratorExit too, when a client disconnects mid-export.
+        if cursor is not None:
+            try:
+                cursor.close()
+            except Exception:
+                pass
+        conn.close()
+
+
+def iter_products():
+    return iter_query("SELECT * FROM products ORDER BY id")
+
+
+def iter_agent_logs():
+    return iter_query("SELECT * FROM agent_logs ORDER BY id DESC")
+
+
+# -----------------------------
+# 2. ROW ENCODERS
+# -----------------------------
+def ndjson_lines(rows, dumps):
+    for row in rows:
+        yield dumps(row) + "\n"
+
+
+def csv_lines(rows, fieldnames):
+    # The declared columns are the contract: missing values are blank, undeclared ones are left out.
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames, extrasaction="ignore")
+    writer.writeheader()
+    yield buffer.getvalue()
+    for row in rows:
+        buffer.seek(0)
+        buffer.truncate(0)
+        writer.writerow(row)
+        yield buffer.getvalue()
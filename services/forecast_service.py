@@ -0,0 +1,189 @@
+import os
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from db_config import MYSQL_SALES_TIME_DDL, MYSQL_SALES_TIME_DEFAULT_DDL, get_backend, get_connection
+
+
+BUCKET_SECONDS = int(os.getenv("FORECAST_BUCKET_SECONDS", "3600"))
+WINDOW_BUCKETS = int(os.getenv("FORECAST_WINDOW_BUCKETS", "6"))
+EWMA_ALPHA = float(os.getenv("FORECAST_EWMA_ALPHA", "0.5"))
+REFRESH_SECONDS = float(os.getenv("FORECAST_REFRESH_SECONDS", "1"))
+# sales needs a timestamp column stamped on insert. The SQLite schema has it; on MySQL
+# ensure_sales_time_column() adds it on the first refresh.
+SALES_TIME_COLUMN = os.getenv("SALES_TIME_COLUMN", "created_at")
+if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", SALES_TIME_COLUMN):
+    raise ValueError(f"SALES_TIME_COLUMN must be a plain column name, got {SALES_TIME_COLUMN!r}")
+TREND_BAND = 0.15
+
+_LOCK = threading.Lock()
+_STATE = {
+    "last_sale_id": 0,
+    "current_bucket": None,
+    "refreshed_at": 0.0,
+    "error": None,
+    "schema_ready": False,
+    "buckets": {},
+    "forecasts": {},
+    "mean_velocity": 0.0
+}
+
+
+# -----------------------------
+# 1. BUCKETING
+# -----------------------------
+def _bucket_of(value):
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() // BUCKET_SECONDS)
+
+
+def _forecast(counts, current_bucket):
+    series = [counts.get(b, 0) for b in range(current_bucket - WINDOW_BUCKETS + 1, current_bucket + 1)]
+    moving_average = sum(series) / len(series)
+    ewma = 0.0
+    for quantity in series:
+        ewma = EWMA_ALPHA * quantity + (1 - EWMA_ALPHA) * ewma
+
+    if ewma == 0:
+        trend = "down"
+    elif ewma > moving_average * (1 + TREND_BAND):
+        trend = "up"
+    elif ewma < moving_average * (1 - TREND_BAND):
+        trend = "down"
+    else:
+        trend = "stable"
+
+    return {
+        "moving_average": round(moving_average, 3),
+        "velocity": round(ewma, 3),
+        "trend": trend
+    }
+
+
+# -----------------------------
+# 2. INCREMENTAL REFRESH
+# -----------------------------
+def ensure_sales_time_column():
+    if get_backend() != "mysql":
+        return
+
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute(
+        "SELECT COUNT(*) FROM information_schema.COLUMNS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'sales' AND COLUMN_NAME = %s",
+        (SALES_TIME_COLUMN,)
+    )
+    if cursor.fetchone()[0] == 0:
+        cursor.execute(MYSQL_SALES_TIME_DDL.format(column=SALES_TIME_COLUMN))
+        cursor.execute(MYSQL_SALES_TIME_DEFAULT_DDL.format(column=SALES_TIME_COLUMN))
+
+    conn.commit()
+    conn.close()
+
+
+def refresh(force=False):
+    with _LOCK:
+        if not force and time.monotonic() - _STATE["refreshed_at"] < REFRESH_SECONDS:
+            # A failed refresh is throttled too: callers fall back without hitting the DB again.
+            if _STATE["error"] is not None:
+                raise _STATE["error"]
+            return
+
+        try:
+            if not _STATE["schema_ready"]:
+                ensure_sales_time_column()
+                _STATE["schema_ready"] = True
+            _refresh()
+            _STATE["error"] = None
+        except Exception as e:
+            _STATE["error"] = RuntimeError(
+                f"sales forecast refresh failed (is sales.{SALES_TIME_COLUMN} present?): {e}"
+            )
+            raise _STATE["error"] from e
+        finally:
+            _STATE["refreshed_at"] = time.monotonic()
+
+
+def _refresh():
+    conn = get_connection()
+    try:
+        cursor = conn.cursor()
+        # The DB clock is the one that stamped the sales rows, so it defines "now".
+        cursor.execute("SELECT CURRENT_TIMESTAMP")
+        current_bucket = _bucket_of(cursor.fetchone()[0])
+
+        cursor.execute(
+            f"SELECT id, product_id, quantity, {SALES_TIME_COLUMN} FROM sales WHERE id > %s ORDER BY id",
+            (_STATE["last_sale_id"],)
+        )
+        buckets = _STATE["buckets"]
+        touched = set()
+        while True:
+            rows = cursor.fetchmany(1000)
+            if not rows:
+                break
+            for sale_id, product_id, quantity, sold_at in rows:
+                _STATE["last_sale_id"] = sale_id
+                if sold_at is None:
+                    # Sold before the column existed: no bucket to put it in.
+                    continue
+                counts = buckets.setdefault(int(product_id), {})
+                bucket = _bucket_of(sold_at)
+                counts[bucket] = counts.get(bucket, 0) + int(quantity or 0)
+                touched.add(int(product_id))
+    finally:
+        conn.close()
+
+    if current_bucket != _STATE["current_bucket"]:
+        oldest = current_bucket - WINDOW_BUCKETS + 1
+        for counts in buckets.values():
+            for bucket in [b for b in counts if b < oldest]:
+                del counts[bucket]
+        touched = set(buckets)
+        _STATE["current_bucket"] = current_bucket
+
+    forecasts = _STATE["forecasts"]
+    for product_id in touched:
+        forecasts[product_id] = _forecast(buckets[product_id], current_bucket)
+
+    if forecasts:
+        _STATE["mean_velocity"] = sum(f["velocity"] for f in forecasts.values()) / len(forecasts)
+
+
+# -----------------------------
+# 3. READ
+# -----------------------------
+def _demand(velocity, mean_velocity):
+    if mean_velocity <= 0:
+        return 34
+    return max(20, min(95, round(56 + 26 * (velocity - mean_velocity) / mean_velocity)))
+
+
+def forecast_version():
+    # Identifies the forecast state responses are built from, so a throttled (stale) forecast
+    # keeps its ETag until a refresh actually changes it. None means forecasts are unavailable.
+    try:
+        refresh()
+    except Exception:
+        return None
+    return _STATE["last_sale_id"], _STATE["current_bucket"]
+
+
+def get_forecast(product_id):
+    refresh()
+    forecast = _STATE["forecasts"].get(int(product_id)) or {"moving_average": 0.0, "velocity": 0.0, "trend": "down"}
+    return {
+        "product_id": int(product_id),
+        **forecast,
+        "demand": _demand(forecast["velocity"], _STATE["mean_velocity"])
+    }
+
+
+def get_trend(product_id):
+    return get_forecast(product_id)["trend"]
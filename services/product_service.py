@@ -8,4 +8,17 @@ def get_all_products():
     products = cursor.fetchall()
 
     conn.close()
-    return products
\ No newline at end of file
+    return products
+
+
+def get_catalog_version():
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute(
+        "SELECT (SELECT COALESCE(MAX(id), 0) FROM sales), (SELECT COALESCE(MAX(id), 0) FROM agent_logs)"
+    )
+    version = tuple(cursor.fetchone())
+
+    conn.close()
+    return version
@@ -0,0 +1,95 @@
+import gzip
+from flask import current_app, request
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+COMPRESSIBLE_MIMETYPES = {
+    "application/json",
+    "application/javascript",
+    "text/javascript",
+    "text/css",
+    "text/html",
+    "text/plain",
+    "text/csv",
+    "image/svg+xml",
+}
+
+
+# -----------------------------
+# 1. FAST JSON ENCODER
+# -----------------------------
+class FastJSONProvider(DefaultJSONProvider):
+    def dumps(self, obj, **kwargs):
+        # response() always passes separators (compact, which orjson already is) or indent (debug).
+        separators = kwargs.pop("separators", None)
+        indent = kwargs.pop("indent", None)
+        if orjson is None or kwargs or indent not in (None, 2) or separators not in (None, (",", ":")):
+            if separators is not None:
+                kwargs["separators"] = separators
+            if indent is not None:
+                kwargs["indent"] = indent
+            return super().dumps(obj, **kwargs)
+
+        # Datetimes go through self.default so both encoders emit the same HTTP-date format.
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+
+# -----------------------------
+# 2. CONTENT NEGOTIATION
+# -----------------------------
+def preferred_encoding():
+    accepted = request.accept_encodings
+    if brotli is not None and accepted["br"]:
+        return "br"
+    if accepted["gzip"]:
+        return "gzip"
+    return None
+
+
+def encoding_etags(etag):
+    return [etag, f"{etag}-gzip", f"{etag}-br"]
+
+
+def compress_response(response):
+    response.vary.add("Accept-Encoding")
+    if (
+        response.status_code != 200
+        or response.direct_passthrough
+        or response.is_streamed
+        or "Content-Encoding" in response.headers
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+    ):
+        return response
+
+    body = response.get_data()
+    if len(body) < current_app.config.get("COMPRESS_MIN_SIZE", 1024):
+        return response
+
+    encoding = preferred_encoding()
+    if encoding == "br":
+        response.set_data(brotli.compress(body, quality=5))
+    elif encoding == "gzip":
+        response.set_data(gzip.compress(body, compresslevel=6))
+    else:
+        return response
+
+    response.headers["Content-Encoding"] = encoding
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(f"{etag}-{encoding}")
+    return response
@@ -1,4 +1,5 @@
 from db_config import get_connection
+from services.forecast_service import get_trend
 import random
 
 
@@ -31,6 +32,14 @@ def simulate_sales():
 # 2. SALES TREND (FOR AGENT)
 # -----------------------------
 def get_sales_trend(product_id):
+    try:
+        return get_trend(product_id)
+    except Exception:
+        # No usable sales timestamps (or the refresh failed): use the all-time total instead.
+        return _total_sales_trend(product_id)
+
+
+def _total_sales_trend(product_id):
     conn = get_connection()
     cursor = conn.cursor()
 
@@ -49,4 +58,4 @@ def get_sales_trend(product_id):
     elif total < 10:
         return "down"
     else:
-        return "stable"
\ No newline at end of file
+        return "stable"
@@ -0,0 +1,104 @@
+import threading
+import time
+from functools import wraps
+from flask import jsonify, request
+
+
+# -----------------------------
+# 1. SINGLE-FLIGHT COALESCING
+# -----------------------------
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = {"done": threading.Event(), "result": None, "error": None}
+                self._calls[key] = call
+
+        if not leader:
+            call["done"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return call["result"]
+
+        try:
+            call["result"] = fn()
+            return call["result"]
+        except Exception as e:
+            call["error"] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call["done"].set()
+
+
+# -----------------------------
+# 2. TOKEN BUCKET
+# -----------------------------
+class LocalBucketStore:
+    def __init__(self, max_keys=10000):
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._max_keys = max_keys
+
+    def update(self, key, fn):
+        with self._lock:
+            state, result = fn(self._buckets.get(key))
+            self._buckets.pop(key, None)
+            self._buckets[key] = state
+            if len(self._buckets) > self._max_keys:
+                self._buckets.pop(next(iter(self._buckets)))
+            return result
+
+
+def client_address():
+    # The peer address. Behind a reverse proxy every client shares the proxy's address:
+    # wrap the app in werkzeug's ProxyFix, or pass a key_fn that reads the forwarded header.
+    return request.remote_addr
+
+
+class TokenBucketLimiter:
+    def __init__(self, rate, capacity, store=None, key_fn=client_address, clock=time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.store = store or LocalBucketStore()
+        self.key_fn = key_fn
+        self._clock = clock
+
+    def acquire(self, key):
+        now = self._clock()
+
+        def take(state):
+            tokens, updated_at = state or (self.capacity, now)
+            tokens = min(self.capacity, tokens + (now - updated_at) * self.rate)
+            if tokens >= 1:
+                return (tokens - 1, now), (True, 0.0)
+            return (tokens, now), (False, (1 - tokens) / self.rate)
+
+        return self.store.update(key, take)
+
+
+def rate_limited(limiter):
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            allowed, retry_after = limiter.acquire((request.endpoint, limiter.key_fn()))
+            if not allowed:
+                response = jsonify({
+                    "ok": False,
+                    "error": "rate_limited",
+                    "message": "Too many requests, slow down.",
+                    "retry_after": round(retry_after, 2)
+                })
+                response.status_code = 429
+                response.headers["Retry-After"] = str(max(1, int(retry_after + 0.999)))
+                return response
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,40 @@
+from db_config import MYSQL_UI_STATE_DDL, get_backend, get_connection
+
+
+def ensure_ui_state_table():
+    # The SQLite schema already creates ui_state on connect.
+    if get_backend() != "mysql":
+        return
+
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute(MYSQL_UI_STATE_DDL)
+
+    conn.commit()
+    conn.close()
+
+
+def load_ui_state():
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    cursor.execute("SELECT kind, product_id, value FROM ui_state")
+    rows = [(kind, int(product_id), int(value)) for kind, product_id, value in cursor.fetchall()]
+
+    conn.close()
+    return rows
+
+
+def persist_ui_state(batch):
+    conn = get_connection()
+    cursor = conn.cursor()
+
+    for (kind, product_id), value in batch.items():
+        cursor.execute(
+            "REPLACE INTO ui_state (kind, product_id, value) VALUES (%s, %s, %s)",
+            (kind, product_id, value)
+        )
+
+    conn.commit()
+    conn.close()
@@ -0,0 +1,119 @@
+import atexit
+import os
+import threading
+import time
+
+
+# -----------------------------
+# WRITE-BEHIND BUFFER
+# -----------------------------
+class WriteBehindBuffer:
+    def __init__(self, flush_fn, interval=1.0, max_batch=500, max_pending=10000, prepare_fn=None, max_backoff=60.0):
+        self._flush_fn = flush_fn
+        self._prepare_fn = prepare_fn
+        self._interval = interval
+        self._max_backoff = max_backoff
+        self._retry_delay = interval
+        self._max_batch = max_batch
+        self._max_pending = max_pending
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._worker = None
+        self._worker_pid = None
+        # Nothing is flushed until prepare_fn (e.g. create table + restore) has succeeded once.
+        self.ready = prepare_fn is None
+        self.dropped = 0
+
+    def __len__(self):
+        return len(self._pending)
+
+    def __contains__(self, key):
+        return key in self._pending
+
+    def put(self, key, value):
+        # Accepted even while the store is down: writes wait (bounded) until prepare succeeds.
+        with self._lock:
+            # Later writes to the same key replace earlier ones, so a burst of clicks is one row.
+            self._pending.pop(key, None)
+            self._pending[key] = value
+            if len(self._pending) > self._max_pending:
+                self._pending.pop(next(iter(self._pending)))
+                self.dropped += 1
+            full = len(self._pending) >= self._max_batch
+        self._ensure_worker()
+        if full:
+            self._wake.set()
+
+    def start(self):
+        self._ensure_worker()
+
+    def _ensure_worker(self):
+        # Threads do not survive fork, so each (pre-forked) worker process starts its own.
+        if self._worker is not None and self._worker_pid == os.getpid():
+            return
+        with self._lock:
+            if self._worker is not None and self._worker_pid == os.getpid():
+                return
+            self._stopped.clear()
+            self._worker = threading.Thread(target=self._run, name="write-behind", daemon=True)
+            self._worker_pid = os.getpid()
+            self._worker.start()
+            atexit.register(self.drain)
+
+    def _run(self):
+        delay = 0
+        while not self._stopped.is_set():
+            self._wake.wait(delay)
+            self._wake.clear()
+            if self.prepare():
+                self.flush()
+                delay = self._interval
+            else:
+                delay = self._retry_delay
+
+    def prepare(self):
+        if self.ready:
+            return True
+        try:
+            self._prepare_fn()
+        except Exception:
+            # Back off exponentially while the store stays unreachable.
+            self._retry_delay = min(self._max_backoff, self._retry_delay * 2)
+            return False
+        self.ready = True
+        self._retry_delay = self._interval
+        return True
+
+    def flush(self):
+        if not self.ready:
+            return 0
+        with self._flush_lock:
+            with self._lock:
+                keys = list(self._pending)[:self._max_batch]
+                batch = {key: self._pending.pop(key) for key in keys}
+            if not batch:
+                return 0
+
+            try:
+                self._flush_fn(batch)
+            except Exception:
+                with self._lock:
+                    for key, value in batch.items():
+                        if key not in self._pending and len(self._pending) < self._max_pending:
+                            self._pending[key] = value
+                        elif key not in self._pending:
+                            self.dropped += 1
+                return 0
+            return len(batch)
+
+    def drain(self, timeout=5.0):
+        self._stopped.set()
+        self._wake.set()
+        deadline = time.monotonic() + timeout
+        while self._pending and time.monotonic() < deadline:
+            if not self.flush():
+                break
+        return len(self._pending)
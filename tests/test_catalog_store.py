@@ -0,0 +1,64 @@
+from services.catalog_store import CHUNK_SIZE, CatalogStore, ProductRows
+
+
+def _store():
+    return CatalogStore.synthetic(CHUNK_SIZE * 2 + 10, seed=1)
+
+
+def test_synthetic_catalogue_indexes_every_row():
+    store = _store()
+    assert len(store) == CHUNK_SIZE * 2 + 10
+    last = store.get(CHUNK_SIZE * 2 + 10)
+    assert last["id"] == CHUNK_SIZE * 2 + 10
+    assert store.get(0) is None
+
+
+def test_snapshot_is_isolated_from_later_writes():
+    store = _store()
+    product_id = CHUNK_SIZE + 5
+    before = store.get(product_id)
+    snapshot = store.snapshot()
+
+    assert store.set_price(product_id, 1.5)
+    assert store.adjust_stock(product_id, -3, floor=-1000) == before["stock"] - 3
+
+    assert snapshot.get(product_id) == before
+    assert store.get(product_id)["price"] == 1.5
+    assert store.get(product_id)["stock"] == before["stock"] - 3
+
+
+def test_only_the_touched_chunk_is_copied_and_second_write_lands_in_place():
+    store = _store()
+    product_id = CHUNK_SIZE + 5
+    chunks_before = list(store._columns["prices"])
+    store.snapshot()
+
+    store.set_price(product_id, 2.0)
+    chunks_after = store._columns["prices"]
+    assert chunks_after[1] is not chunks_before[1]
+    assert chunks_after[0] is chunks_before[0]
+    assert chunks_after[2] is chunks_before[2]
+
+    copied = chunks_after[1]
+    store.set_price(product_id + 1, 3.0)
+    assert store._columns["prices"][1] is copied
+
+
+def test_writes_before_any_snapshot_are_in_place():
+    store = _store()
+    chunk = store._columns["stocks"][0]
+    store.adjust_stock(1, 5)
+    assert store._columns["stocks"][0] is chunk
+
+
+def test_unknown_product_writes_are_rejected():
+    store = _store()
+    assert store.set_price(10 ** 9, 1.0) is False
+    assert store.adjust_stock(10 ** 9, 1) is None
+
+
+def test_product_rows_lookup_by_id():
+    rows = ProductRows([{"id": 3, "name": "a"}, {"id": 7, "name": "b"}])
+    assert rows.get("7")["name"] == "b"
+    assert rows.get(8) is None
+    assert [p["id"] for p in rows] == [3, 7]
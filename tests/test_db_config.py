@@ -0,0 +1,18 @@
+import db_config
+
+
+def test_closing_a_sqlite_connection_twice_pools_it_once(monkeypatch, tmp_path):
+    monkeypatch.setenv("DB_BACKEND", "sqlite")
+    monkeypatch.setenv("SQLITE_PATH", str(tmp_path / "pool.db"))
+    monkeypatch.setattr(db_config, "_SQLITE_POOL", type(db_config._SQLITE_POOL)())
+
+    conn = db_config.get_connection()
+    conn.close()
+    conn.close()
+    assert len(db_config._SQLITE_POOL.idle) == 1
+
+    first = db_config.get_connection()
+    second = db_config.get_connection()
+    assert first._conn is not second._conn
+    first.discard()
+    second.discard()
@@ -0,0 +1,18 @@
+import csv
+import io
+
+from services.export_service import csv_lines
+
+
+def _parse(lines):
+    return list(csv.reader(io.StringIO("".join(lines))))
+
+
+def test_csv_lines_uses_declared_fieldnames_for_every_row():
+    rows = [{"b": 2, "a": 1}, {"a": 3, "c": "extra"}]
+    parsed = _parse(csv_lines(iter(rows), ["a", "b"]))
+    assert parsed == [["a", "b"], ["1", "2"], ["3", ""]]
+
+
+def test_csv_lines_writes_header_for_empty_result():
+    assert _parse(csv_lines(iter([]), ["a", "b"])) == [["a", "b"]]
@@ -0,0 +1,72 @@
+import sqlite3
+
+import pytest
+
+import db_config
+from services import forecast_service, sales_service
+
+
+@pytest.fixture
+def sqlite_db(monkeypatch, tmp_path):
+    monkeypatch.setenv("DB_BACKEND", "sqlite")
+    monkeypatch.setenv("SQLITE_PATH", str(tmp_path / "forecast.db"))
+    monkeypatch.setattr(db_config, "_SQLITE_POOL", type(db_config._SQLITE_POOL)())
+    monkeypatch.setattr(forecast_service, "_STATE", {
+        "last_sale_id": 0,
+        "current_bucket": None,
+        "refreshed_at": 0.0,
+        "error": None,
+        "schema_ready": False,
+        "buckets": {},
+        "forecasts": {},
+        "mean_velocity": 0.0
+    })
+    monkeypatch.setattr(forecast_service, "REFRESH_SECONDS", 60)
+
+
+def _sell(product_id, quantity, created_at="CURRENT_TIMESTAMP"):
+    conn = db_config.get_connection()
+    conn.cursor().execute(
+        f"INSERT INTO sales (product_id, quantity, created_at) VALUES (%s, %s, {created_at})",
+        (product_id, quantity)
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_forecast_version_follows_the_refreshed_state_not_the_newest_sale(sqlite_db):
+    _sell(1, 3)
+    version = forecast_service.forecast_version()
+    assert version[0] == 1
+
+    _sell(1, 2)
+    # Still inside the refresh window: the forecast (and so the ETag key) has not moved yet.
+    assert forecast_service.forecast_version() == version
+
+    forecast_service.refresh(force=True)
+    assert forecast_service.forecast_version()[0] == 2
+
+
+def test_sales_without_a_timestamp_are_skipped(sqlite_db, tmp_path):
+    # Like a MySQL sales table right after the column was added: older rows are NULL.
+    legacy = sqlite3.connect(str(tmp_path / "forecast.db"))
+    legacy.execute("CREATE TABLE sales (id INTEGER PRIMARY KEY, product_id INTEGER, quantity INTEGER, created_at TEXT)")
+    legacy.commit()
+    legacy.close()
+    _sell(1, 5, created_at="NULL")
+    _sell(2, 1)
+
+    forecast_service.refresh(force=True)
+    assert forecast_service._STATE["last_sale_id"] == 2
+    assert forecast_service.get_forecast(1)["velocity"] == 0.0
+    assert forecast_service.get_forecast(2)["velocity"] > 0
+
+
+def test_sales_trend_falls_back_to_totals_when_forecasts_fail(sqlite_db, monkeypatch):
+    def broken(product_id):
+        raise RuntimeError("no sales timestamps")
+
+    monkeypatch.setattr(sales_service, "get_trend", broken)
+    _sell(1, 25)
+    assert sales_service.get_sales_trend(1) == "up"
+    assert sales_service.get_sales_trend(2) == "down"
@@ -0,0 +1,47 @@
+import datetime
+
+import pytest
+from flask import Flask, jsonify
+
+from services import response_service
+from services.response_service import FastJSONProvider
+
+
+def _app(debug=False):
+    app = Flask(__name__)
+    app.debug = debug
+    app.json = FastJSONProvider(app)
+
+    @app.route("/data")
+    def data():
+        return jsonify({"b": 1, "a": datetime.datetime(2026, 10, 19, 2, 0, 0)})
+
+    return app
+
+
+@pytest.mark.parametrize("debug", [False, True])
+def test_jsonify_goes_through_orjson(monkeypatch, debug):
+    orjson = pytest.importorskip("orjson")
+    real_dumps = orjson.dumps
+    calls = []
+
+    def spy(*args, **kwargs):
+        calls.append(kwargs)
+        return real_dumps(*args, **kwargs)
+
+    monkeypatch.setattr(response_service.orjson, "dumps", spy)
+    response = _app(debug).test_client().get("/data")
+
+    assert len(calls) == 1
+    assert bool(calls[0]["option"] & orjson.OPT_INDENT_2) is debug
+    assert response.get_json() == {"a": "Mon, 19 Oct 2026 02:00:00 GMT", "b": 1}
+
+
+def test_orjson_output_matches_default_provider():
+    pytest.importorskip("orjson")
+    app = _app()
+    payload = {"b": [1, 2.5, None], "a": datetime.date(2026, 10, 19), "c": {"z": 1, "y": 2}}
+    with app.app_context():
+        fast = app.json.dumps(payload, separators=(",", ":"))
+        default = super(FastJSONProvider, app.json).dumps(payload, separators=(",", ":"))
+    assert fast == default
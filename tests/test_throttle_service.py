@@ -0,0 +1,124 @@
+import threading
+import time
+
+import pytest
+from flask import Flask
+
+from services.throttle_service import LocalBucketStore, SingleFlight, TokenBucketLimiter, rate_limited
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _run_concurrently(flight, fn, waiters=4):
+    started = threading.Event()
+    release = threading.Event()
+    outcomes = []
+
+    def leader_fn():
+        started.set()
+        release.wait(5)
+        return fn()
+
+    def call(target):
+        try:
+            outcomes.append(("ok", flight.do("key", target)))
+        except Exception as e:
+            outcomes.append(("error", e))
+
+    leader = threading.Thread(target=call, args=(leader_fn,))
+    leader.start()
+    started.wait(5)
+    # Waiters pass a function that must never run: they join the leader's call.
+    threads = [threading.Thread(target=call, args=(lambda: pytest.fail("waiter ran fn"),)) for _ in range(waiters)]
+    for t in threads:
+        t.start()
+    # Give the waiters time to block on the leader's call before it completes.
+    time.sleep(0.2)
+    release.set()
+    for t in [leader, *threads]:
+        t.join(5)
+    return outcomes
+
+
+def test_single_flight_waiters_share_the_leaders_result():
+    calls = []
+
+    def fn():
+        calls.append(1)
+        return {"answer": 42}
+
+    outcomes = _run_concurrently(SingleFlight(), fn)
+    assert len(calls) == 1
+    assert len(outcomes) == 5
+    assert all(kind == "ok" and value is outcomes[0][1] for kind, value in outcomes)
+
+
+def test_single_flight_waiters_share_the_leaders_error():
+    error = RuntimeError("db down")
+
+    def fn():
+        raise error
+
+    flight = SingleFlight()
+    outcomes = _run_concurrently(flight, fn)
+    assert outcomes == [("error", error)] * 5
+    # The failed call is forgotten, so the next caller retries.
+    assert flight.do("key", lambda: "fresh") == "fresh"
+
+
+def test_token_bucket_refills_at_rate_and_reports_retry_after():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(rate=0.5, capacity=2, clock=clock)
+
+    assert limiter.acquire("a") == (True, 0.0)
+    assert limiter.acquire("a") == (True, 0.0)
+    allowed, retry_after = limiter.acquire("a")
+    assert not allowed
+    assert retry_after == pytest.approx(2.0)
+
+    clock.now += 1.0
+    allowed, retry_after = limiter.acquire("a")
+    assert not allowed
+    assert retry_after == pytest.approx(1.0)
+
+    clock.now += 1.0
+    assert limiter.acquire("a")[0]
+    # Buckets are per key.
+    assert limiter.acquire("b")[0]
+
+
+def test_local_bucket_store_evicts_least_recently_used_key():
+    store = LocalBucketStore(max_keys=2)
+    store.update("a", lambda state: ("A", None))
+    store.update("b", lambda state: ("B", None))
+    store.update("a", lambda state: (state, None))
+    store.update("c", lambda state: ("C", None))
+
+    assert store.update("a", lambda state: (state, state)) == "A"
+    assert store.update("b", lambda state: (state, state)) is None
+
+
+def test_rate_limited_returns_429_with_retry_after_per_client_key():
+    clock = FakeClock()
+    limiter = TokenBucketLimiter(rate=0.25, capacity=1, clock=clock, key_fn=lambda: "tenant-1")
+    app = Flask(__name__)
+
+    @app.route("/heavy")
+    @rate_limited(limiter)
+    def heavy():
+        return {"ok": True}
+
+    client = app.test_client()
+    assert client.get("/heavy").status_code == 200
+
+    response = client.get("/heavy")
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "4"
+    assert response.get_json()["error"] == "rate_limited"
+    assert ("heavy", "tenant-1") in limiter.store._buckets
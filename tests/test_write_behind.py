@@ -0,0 +1,83 @@
+from services.write_behind import WriteBehindBuffer
+
+
+def _manual(buffer, monkeypatch):
+    # Drive prepare/flush from the test instead of the background worker.
+    monkeypatch.setattr(buffer, "_ensure_worker", lambda: None)
+    return buffer
+
+
+def test_writes_wait_for_prepare_and_retry_backs_off(monkeypatch):
+    flushed = []
+    attempts = []
+
+    def prepare():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("db down")
+
+    buffer = _manual(WriteBehindBuffer(flushed.append, interval=1.0, prepare_fn=prepare, max_backoff=3.0), monkeypatch)
+    buffer.put("a", 1)
+    assert buffer.flush() == 0
+    assert "a" in buffer
+
+    assert not buffer.prepare()
+    assert buffer._retry_delay == 2.0
+    assert not buffer.prepare()
+    assert buffer._retry_delay == 3.0
+
+    assert buffer.prepare()
+    assert buffer._retry_delay == 1.0
+    assert buffer.flush() == 1
+    assert flushed == [{"a": 1}]
+
+
+def test_put_coalesces_writes_to_the_same_key(monkeypatch):
+    flushed = []
+    buffer = _manual(WriteBehindBuffer(flushed.append), monkeypatch)
+    buffer.put(("like", 1), 1)
+    buffer.put(("like", 2), 1)
+    buffer.put(("like", 1), 0)
+
+    assert len(buffer) == 2
+    assert buffer.flush() == 2
+    assert flushed == [{("like", 2): 1, ("like", 1): 0}]
+
+
+def test_failed_flush_requeues_without_overwriting_newer_writes(monkeypatch):
+    buffer = None
+    calls = []
+
+    def flaky(batch):
+        calls.append(dict(batch))
+        if len(calls) == 1:
+            # A newer write lands while the failing batch is in flight.
+            buffer.put("a", 2)
+            raise ConnectionError("db down")
+
+    buffer = _manual(WriteBehindBuffer(flaky), monkeypatch)
+    buffer.put("a", 1)
+    buffer.put("b", 1)
+
+    assert buffer.flush() == 0
+    assert buffer.flush() == 2
+    assert calls[1] == {"a": 2, "b": 1}
+
+
+def test_max_pending_drops_oldest_writes(monkeypatch):
+    buffer = _manual(WriteBehindBuffer(lambda batch: None, max_pending=2), monkeypatch)
+    for key in "abc":
+        buffer.put(key, 1)
+
+    assert "a" not in buffer
+    assert buffer.dropped == 1
+
+
+def test_drain_flushes_everything_in_batches(monkeypatch):
+    flushed = []
+    buffer = _manual(WriteBehindBuffer(flushed.append, max_batch=2), monkeypatch)
+    for key in range(5):
+        buffer.put(key, key)
+
+    assert buffer.drain() == 0
+    assert [len(batch) for batch in flushed] == [2, 2, 1]